@@ -5,27 +5,66 @@ Konvertiert DeepSeek conversations.json in einzelne Markdown-Dateien
 Verwendung: python deepseek_export.py [datei.json]
 """
 
+import functools
+import heapq
+import itertools
 import json
+import mmap
 import os
+import signal
 import sys
 from datetime import datetime
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Threads pro Aufgabe für den Prozess-Pool
+EXPORT_BATCH_SIZE = 16
+
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# Überschriften je Nachrichtentyp; andere Typen erhalten ihren Namen als Überschrift
+ROLE_HEADERS = {
+    'REQUEST': "### 👤 Sie\n\n",
+    'RESPONSE': "### 🤖 DeepSeek\n\n",
+}
+
+# Zeile der Thread-Übersicht, gefüllt aus der Statistik von export_thread()
+format_index_row = "| {idx} | [{filename}](./{filename}) | {title} | {messages} | {size_kb:.1f} KB |\n".format
+
+# Übersetzungstabellen für Dateinamen: ungültige Zeichen -> '_', Steuerzeichen entfernen
+FILENAME_TABLE = str.maketrans(
+    {**{c: '_' for c in '<>:"/\\|?*'}, **{chr(c): None for c in range(0x20)}, '\x7f': None}
+)
+FILENAME_SPACES_TABLE = {**FILENAME_TABLE, ord(' '): '_'}
+
+# Vorkompilierte Muster für Dateinamen und Nachrichten-IDs
+UNDERSCORE_RUN_RE = re.compile(r'_+')
+DIGIT_RE = re.compile(r'\d+')
+
 def sanitize_filename(filename, replace_spaces=True):
     """
     Macht Dateinamen sicher für das Dateisystem
     """
-    if replace_spaces:
-        filename = filename.replace(' ', '_')
-    
-    # Entferne oder ersetze ungültige Zeichen
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
-    filename = filename.strip('._ ')
+    # Ungültige Zeichen ersetzen, Steuerzeichen entfernen (ein Durchlauf)
+    filename = filename.translate(FILENAME_SPACES_TABLE if replace_spaces else FILENAME_TABLE)
     
     # Reduziere mehrere Unterstriche auf einen
-    filename = re.sub(r'_+', '_', filename)
+    filename = UNDERSCORE_RUN_RE.sub('_', filename).strip('._ ')
     
     # Maximallänge begrenzen
     if len(filename) > 200:
@@ -39,13 +78,63 @@ def sanitize_filename(filename, replace_spaces=True):
     
     return filename
 
+def extract_numeric_id(msg_id):
+    """Liefert die erste Zahl einer Nachrichten-ID als Sortierschlüssel"""
+    # DeepSeek-IDs sind meist reine Zahlen, dann ist kein Regex nötig
+    if msg_id.isdecimal():
+        return int(msg_id)
+    
+    match = DIGIT_RE.search(msg_id)
+    return int(match.group()) if match else float('inf')
+
+def extract_messages(mapping):
+    """
+    Sammelt alle nicht-leeren Nachrichtenfragmente aus dem Mapping eines Threads
+    als Tupel (Sortierschlüssel, Typ, Inhalt). Ungültige Einträge werden übersprungen.
+    """
+    messages = []
+    for msg_id, msg_data in mapping.items():
+        if msg_id == "root":
+            continue
+        
+        # Direkter Zugriff statt isinstance-Prüfungen; fehlerhafte Einträge lösen
+        # eine Ausnahme aus und werden übersprungen
+        try:
+            fragments = msg_data['message']['fragments'] or ()
+        except (TypeError, KeyError):
+            continue
+        
+        sort_key = extract_numeric_id(msg_id)
+        for fragment in fragments:
+            try:
+                content = fragment['content']
+                if content.strip():
+                    msg_type = fragment.get('type', '')
+                    if not isinstance(msg_type, str):
+                        # Typ dient als Schlüssel für ROLE_HEADERS und muss hashbar sein
+                        msg_type = str(msg_type)
+                    messages.append((sort_key, msg_type, content))
+            except (TypeError, KeyError, AttributeError):
+                continue
+    
+    return messages
+
+@functools.lru_cache(maxsize=1024)
+def format_iso_date(value):
+    """Wandelt einen ISO-Zeitstempel in TT.MM.JJJJ HH:MM:SS um"""
+    if sys.version_info < (3, 11):
+        # Erst ab Python 3.11 versteht fromisoformat das 'Z' für UTC
+        value = value.replace('Z', '+00:00')
+    
+    dt = datetime.fromisoformat(value)
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
 def create_thread_folder(base_folder="deepseek_chats"):
     """Erstellt einen Ordner für die Threads mit Datumsstempel"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     folder_name = f"{base_folder}_{timestamp}"
     
-    if not os.path.exists(folder_name):
-        os.makedirs(folder_name)
+    os.makedirs(folder_name, exist_ok=True)
     
     return folder_name
 
@@ -68,45 +157,255 @@ def find_json_file(input_arg=None):
             return filename
     
     # 3. Alle .json Dateien im aktuellen Ordner
-    json_files = [f for f in os.listdir('.') if f.lower().endswith('.json')]
+    # scandir liefert den Dateityp meist schon beim Auflisten (kein stat() für is_file)
+    with os.scandir('.') as entries:
+        json_files = [entry for entry in entries
+                      if entry.is_file() and entry.name.lower().endswith('.json')]
     
     if len(json_files) == 1:
-        return json_files[0]
+        return json_files[0].name
     elif len(json_files) > 1:
         print("\nMehrere JSON-Dateien gefunden:")
-        for i, f in enumerate(json_files, 1):
-            size = os.path.getsize(f) / (1024*1024)
-            print(f"  {i}. {f} ({size:.1f} MB)")
+        for i, entry in enumerate(json_files, 1):
+            size = entry.stat().st_size / (1024*1024)
+            print(f"  {i}. {entry.name} ({size:.1f} MB)")
         
         try:
             choice = int(input(f"\nWählen Sie eine Datei (1-{len(json_files)}): "))
             if 1 <= choice <= len(json_files):
-                return json_files[choice-1]
+                return json_files[choice-1].name
         except:
             pass
     
     return None
 
+def advise_sequential(f):
+    """Kündigt dem Betriebssystem sequentielles Lesen an (nur POSIX)"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def load_json(input_file):
+    """
+    Lädt die JSON-Datei, bevorzugt mit orjson (deutlich schneller als json)
+    """
+    with open(input_file, 'rb') as f:
+        advise_sequential(f)
+        
+        if orjson is not None:
+            # Datei einblenden statt einlesen: orjson parst direkt aus dem
+            # Mapping, ohne Kopie des Dateiinhalts im Python-Heap
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Leere Datei oder nicht einblendbar (z.B. Pipe)
+                mm = None
+            
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    # UTF-8 BOM überspringen (z.B. von Windows-Editoren)
+                    start = len(UTF8_BOM) if view[:len(UTF8_BOM)] == UTF8_BOM else 0
+                    with view[start:] as content:
+                        return orjson.loads(content)
+        
+        raw = f.read()
+    
+    # UTF-8 BOM entfernen (z.B. von Windows-Editoren)
+    if raw.startswith(UTF8_BOM):
+        raw = raw[len(UTF8_BOM):]
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+def stream_threads(input_file, start=0):
+    """Liefert die Elemente des JSON-Arrays einzeln (ijson)"""
+    with open(input_file, 'rb') as f:
+        advise_sequential(f)
+        f.seek(start)
+        yield from ijson.items(f, 'item', use_float=True)
+
+def read_threads(input_file):
+    """
+    Liefert (Threads, Anzahl). Mit ijson wird die Datei gestreamt, statt sie
+    komplett in den Speicher zu laden; die Anzahl ist dann vorab unbekannt (None).
+    """
+    if ijson is not None:
+        with open(input_file, 'rb') as f:
+            head = f.read(1024)
+        start = len(UTF8_BOM) if head.startswith(UTF8_BOM) else 0
+        
+        # Nur ein Array auf oberster Ebene kann gestreamt werden
+        if head[start:].lstrip().startswith(b'['):
+            return stream_threads(input_file, start), None
+    
+    data = load_json(input_file)
+    
+    # Prüfe Datenformat
+    if not isinstance(data, list):
+        data = [data]
+    
+    return iter(data), len(data)
+
+def export_thread(thread, thread_idx, folder, max_messages_per_file=None):
+    """
+    Schreibt einen Thread als Markdown-Datei und gibt dessen Statistik zurück
+    """
+    # Thread-Informationen
+    thread_id = thread.get('id', '')
+    title = thread.get('title', f'Thread_{thread_idx}')
+    inserted_at = thread.get('inserted_at', '')
+    
+    # Dateinamen erstellen (OHNE Leerzeichen)
+    safe_title = sanitize_filename(title, replace_spaces=True)
+    
+    # Dateiname mit führender Nummer
+    filename = f"{thread_idx:03d}_{safe_title}.md"
+    filepath = os.path.join(folder, filename)
+    
+    # Thread-Inhalt sammeln und in einem Schritt schreiben
+    parts = [f"# {title}\n\n"]
+    
+    # Metadaten
+    parts.append("**Metadaten:**\n")
+    parts.append(f"- Thread-ID: `{thread_id}`\n")
+    if inserted_at:
+        try:
+            formatted_date = format_iso_date(inserted_at)
+            parts.append(f"- Erstellt: {formatted_date}\n")
+        except:
+            parts.append(f"- Erstellt: {inserted_at}\n")
+    
+    parts.append(f"- Datei: `{filename}`\n")
+    parts.append("\n---\n\n")
+    
+    # Nachrichten extrahieren
+    mapping = thread.get('mapping', {})
+    thread_messages = 0
+    all_messages = extract_messages(mapping)
+    
+    # Nachrichten sortieren (bei Begrenzung nur die ersten N auswählen)
+    message_count = len(all_messages)
+    truncated = bool(max_messages_per_file) and message_count > max_messages_per_file
+    # Nur nach dem Schlüssel sortieren, damit die Reihenfolge stabil bleibt
+    if truncated:
+        all_messages = heapq.nsmallest(max_messages_per_file, all_messages, key=itemgetter(0))
+    else:
+        all_messages.sort(key=itemgetter(0))
+    
+    # Nachrichten ausgeben
+    parts.append("## Chat-Verlauf\n\n")
+    
+    for _, msg_type, content in all_messages:
+        parts.append(ROLE_HEADERS.get(msg_type) or f"### {msg_type}\n\n")
+        
+        parts.append(f"{content}\n\n")
+        thread_messages += 1
+    
+    if truncated:
+        remaining = message_count - max_messages_per_file
+        parts.append(f"\n> *Hinweis: {remaining} weitere Nachrichten gekürzt.*\n")
+    
+    # Zusammenfassung
+    parts.append("---\n\n")
+    parts.append(f"**Statistik:** {thread_messages} Nachrichten\n")
+    
+    # Binär schreiben: die Dateigröße ergibt sich aus den geschriebenen Bytes
+    with open(filepath, 'wb') as out:
+        file_size_kb = out.write(''.join(parts).encode('utf-8')) / 1024
+    
+    # Statistik
+    return {
+        'idx': thread_idx,
+        'filename': filename,
+        'title': title,
+        'messages': thread_messages,
+        'size_kb': file_size_kb
+    }
+
+def export_batch(numbered_threads, folder, max_messages_per_file=None):
+    """
+    Exportiert eine Gruppe von (Nummer, Thread)-Paaren.
+    Liefert (Nummer, Statistik) je Thread; None bei ungültigen Threads.
+    """
+    results = []
+    for thread_idx, thread in numbered_threads:
+        if isinstance(thread, dict):
+            results.append((thread_idx, export_thread(thread, thread_idx, folder, max_messages_per_file)))
+        else:
+            results.append((thread_idx, None))
+    return results
+
+def ignore_sigint():
+    """Worker-Prozesse ignorieren Strg+C; der Abbruch wird im Hauptprozess behandelt"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def run_exports(numbered_threads, folder, max_messages_per_file=None, parallel=True):
+    """
+    Exportiert die Threads, auf Wunsch parallel in mehreren Prozessen.
+    Liefert (Nummer, Statistik) in Eingabereihenfolge; None bei ungültigen Threads.
+    """
+    if not parallel:
+        for item in numbered_threads:
+            yield from export_batch([item], folder, max_messages_per_file)
+        return
+    
+    # Threads gruppenweise und nur begrenzt viele gleichzeitig einreichen, damit
+    # die Eingabe weiterhin gestreamt wird und nicht komplett im Speicher landet
+    max_pending = (os.cpu_count() or 1) * 2
+    pending = deque()
+    batch = []
+    read_error = None
+    
+    with ProcessPoolExecutor(initializer=ignore_sigint) as executor:
+        try:
+            for item in numbered_threads:
+                batch.append(item)
+                if len(batch) < EXPORT_BATCH_SIZE:
+                    continue
+                
+                pending.append(executor.submit(export_batch, batch, folder, max_messages_per_file))
+                batch = []
+                
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+        except JSON_ERRORS as e:
+            # Bereits gelesene Threads noch abschließen
+            read_error = e
+        
+        if batch:
+            pending.append(executor.submit(export_batch, batch, folder, max_messages_per_file))
+        
+        while pending:
+            yield from pending.popleft().result()
+    
+    if read_error:
+        raise read_error
+
 def export_threads(input_file, max_threads=None, max_messages_per_file=None):
     """
     Exportiert jeden Thread als separate Markdown-Datei
     """
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        threads, thread_count = read_threads(input_file)
+        # Erster Thread vorab, damit Lesefehler vor dem Anlegen des Ordners auffallen
+        pending = [next(threads)]
+    except StopIteration:
+        pending = []
+    except JSON_ERRORS as e:
         print(f"❌ Fehler beim Lesen der JSON-Datei: {e}")
         return None
-    except UnicodeDecodeError:
-        # Versuche mit anderer Kodierung
-        try:
-            with open(input_file, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
-        except Exception as e:
-            print(f"❌ Fehler beim Lesen der Datei: {e}")
-            return None
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ Fehler beim Lesen der Datei: {e}")
+        return None
     
-    print(f"✓ Datei geladen: {len(data) if isinstance(data, list) else '1'} Thread(s)")
+    if thread_count is None:
+        # Beim Streamen ist die Anzahl der Threads erst am Ende bekannt
+        print(f"✓ Datei geöffnet: {input_file}")
+    else:
+        print(f"✓ Datei geladen: {thread_count} Thread(s)")
     
     # Ordner erstellen
     input_name = Path(input_file).stem
@@ -117,163 +416,76 @@ def export_threads(input_file, max_threads=None, max_messages_per_file=None):
     total_messages = 0
     stats = []
     
-    # Index-Datei
-    index_file = os.path.join(folder, "00_INDEX.md")
+    export_date = datetime.now().strftime('%d.%m.%Y %H:%M:%S')
+    index_rows = []
+    threads_read = 0
     
-    with open(index_file, 'w', encoding='utf-8') as index:
-        index.write(f"# DeepSeek Chat Export\n\n")
-        index.write(f"**Quelldatei:** `{input_file}`\n")
-        index.write(f"**Export-Datum:** {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}\n")
-        index.write(f"**Anzahl Threads:** {len(data) if isinstance(data, list) else 1}\n\n")
-        index.write("## Thread-Übersicht\n\n")
-        index.write("| Nr. | Datei | Titel | Nachrichten | Größe |\n")
-        index.write("|-----|-------|-------|-------------|-------|\n")
+    # Threads verarbeiten (Testlauf und Einzelkern-Rechner ohne Prozess-Pool)
+    numbered = itertools.islice(enumerate(itertools.chain(pending, threads), 1), max_threads or None)
+    parallel = not (max_threads and max_threads <= 5) and (os.cpu_count() or 1) >= 2
     
-    # Prüfe Datenformat
-    if not isinstance(data, list):
-        data = [data]
-    
-    # Threads verarbeiten
-    for thread_idx, thread in enumerate(data, 1):
-        if max_threads and thread_idx > max_threads:
-            break
-            
-        if not isinstance(thread, dict):
-            print(f"  Thread {thread_idx}: Ungültiges Format - übersprungen")
-            continue
-        
-        # Thread-Informationen
-        thread_id = thread.get('id', '')
-        title = thread.get('title', f'Thread_{thread_idx}')
-        inserted_at = thread.get('inserted_at', '')
-        
-        # Dateinamen erstellen (OHNE Leerzeichen)
-        safe_title = sanitize_filename(title, replace_spaces=True)
-        
-        # Dateiname mit führender Nummer
-        filename = f"{thread_idx:03d}_{safe_title}.md"
-        filepath = os.path.join(folder, filename)
-        
-        print(f"Thread {thread_idx}: {title}")
-        
-        # Thread-Datei erstellen
-        with open(filepath, 'w', encoding='utf-8') as out:
-            out.write(f"# {title}\n\n")
-            
-            # Metadaten
-            out.write("**Metadaten:**\n")
-            out.write(f"- Thread-ID: `{thread_id}`\n")
-            if inserted_at:
-                try:
-                    dt = datetime.fromisoformat(inserted_at.replace('Z', '+00:00'))
-                    formatted_date = dt.strftime('%d.%m.%Y %H:%M:%S')
-                    out.write(f"- Erstellt: {formatted_date}\n")
-                except:
-                    out.write(f"- Erstellt: {inserted_at}\n")
-            
-            out.write(f"- Datei: `{filename}`\n")
-            out.write("\n---\n\n")
-            
-            # Nachrichten extrahieren
-            mapping = thread.get('mapping', {})
-            thread_messages = 0
-            all_messages = []
-            
-            for msg_id, msg_data in mapping.items():
-                if not isinstance(msg_data, dict) or msg_id == "root":
-                    continue
-                
-                message = msg_data.get('message')
-                if not message or not isinstance(message, dict):
-                    continue
-                
-                fragments = message.get('fragments', [])
-                for fragment in fragments:
-                    if isinstance(fragment, dict):
-                        msg_type = fragment.get('type', '')
-                        content = fragment.get('content', '')
-                        
-                        if content and content.strip():
-                            all_messages.append({
-                                'id': msg_id,
-                                'type': msg_type,
-                                'content': content
-                            })
+    try:
+        for thread_idx, stat in run_exports(numbered, folder, max_messages_per_file, parallel):
+            threads_read = thread_idx
             
-            # Nachrichten sortieren
-            try:
-                def extract_numeric_id(msg_id):
-                    numbers = re.findall(r'\d+', msg_id)
-                    return int(numbers[0]) if numbers else float('inf')
-                
-                all_messages.sort(key=lambda x: extract_numeric_id(x['id']))
-            except:
-                pass
+            if stat is None:
+                print(f"  Thread {thread_idx}: Ungültiges Format - übersprungen")
+                continue
             
-            # Nachrichten ausgeben
-            out.write("## Chat-Verlauf\n\n")
+            stats.append(stat)
             
-            for i, msg in enumerate(all_messages):
-                if max_messages_per_file and i >= max_messages_per_file:
-                    remaining = len(all_messages) - max_messages_per_file
-                    out.write(f"\n> *Hinweis: {remaining} weitere Nachrichten gekürzt.*\n")
-                    break
-                
-                if msg['type'] == 'REQUEST':
-                    out.write("### 👤 Sie\n\n")
-                elif msg['type'] == 'RESPONSE':
-                    out.write("### 🤖 DeepSeek\n\n")
-                else:
-                    out.write(f"### {msg['type']}\n\n")
-                
-                out.write(f"{msg['content']}\n\n")
-                thread_messages += 1
-                total_messages += 1
+            # Beide Fortschrittszeilen in einem Aufruf ausgeben
+            sys.stdout.write(
+                f"Thread {thread_idx}: {stat['title']}\n"
+                f"  → {stat['messages']} Nachrichten in '{stat['filename']}' ({stat['size_kb']:.1f} KB)\n"
+            )
+            total_threads += 1
+            total_messages += stat['messages']
             
-            # Zusammenfassung
-            out.write("---\n\n")
-            out.write(f"**Statistik:** {thread_messages} Nachrichten\n")
-        
-        # Dateigröße
-        file_size_kb = os.path.getsize(filepath) / 1024
-        
-        # Statistik
-        stats.append({
-            'idx': thread_idx,
-            'filename': filename,
-            'title': title,
-            'messages': thread_messages,
-            'size_kb': file_size_kb
-        })
-        
-        print(f"  → {thread_messages} Nachrichten in '{filename}' ({file_size_kb:.1f} KB)")
-        total_threads += 1
-        
-        # Index aktualisieren
-        with open(index_file, 'a', encoding='utf-8') as index:
-            index.write(f"| {thread_idx} | [{filename}](./{filename}) | {title} | {thread_messages} | {file_size_kb:.1f} KB |\n")
-    
-    # Index-Datei vervollständigen
-    with open(index_file, 'a', encoding='utf-8') as index:
-        index.write(f"\n## Gesamtstatistik\n")
-        index.write(f"- **Exportierte Threads:** {total_threads}\n")
-        index.write(f"- **Gesamtnachrichten:** {total_messages}\n")
-        
-        if total_threads > 0:
-            avg_messages = total_messages / total_threads
-            index.write(f"- **Durchschnitt pro Thread:** {avg_messages:.1f} Nachrichten\n")
-        
-        total_size_mb = sum(stat['size_kb'] for stat in stats) / 1024
-        index.write(f"- **Gesamtgröße:** {total_size_mb:.2f} MB\n")
-        
-        if stats:
-            largest = max(stats, key=lambda x: x['size_kb'])
-            smallest = min(stats, key=lambda x: x['size_kb'])
-            index.write(f"- **Größte Datei:** {largest['filename']} ({largest['size_kb']:.1f} KB)\n")
-            index.write(f"- **Kleinste Datei:** {smallest['filename']} ({smallest['size_kb']:.1f} KB)\n")
-        
-        index.write(f"\n**Ordner:** `{folder}`\n")
-        index.write(f"**Index:** [00_INDEX.md](./00_INDEX.md)\n")
+            # Index-Zeile merken, die Datei wird am Ende in einem Schritt geschrieben
+            index_rows.append(format_index_row(**stat))
+    except JSON_ERRORS as e:
+        print(f"❌ Fehler beim Lesen der JSON-Datei: {e}")
+        print(f"   Export nach {total_threads} Thread(s) abgebrochen.")
+    
+    # Gesamtstatistik einmal berechnen (für Index und Konsole)
+    total_size_mb = sum(stat['size_kb'] for stat in stats) / 1024
+    top_files = heapq.nlargest(5, stats, key=lambda x: x['size_kb'])
+    
+    # Index-Datei
+    index_parts = [
+        f"# DeepSeek Chat Export\n\n",
+        f"**Quelldatei:** `{input_file}`\n",
+        f"**Export-Datum:** {export_date}\n",
+        f"**Anzahl Threads:** {threads_read}\n\n",
+        "## Thread-Übersicht\n\n",
+        "| Nr. | Datei | Titel | Nachrichten | Größe |\n",
+        "|-----|-------|-------|-------------|-------|\n",
+    ]
+    index_parts.extend(index_rows)
+    
+    index_parts.append(f"\n## Gesamtstatistik\n")
+    index_parts.append(f"- **Exportierte Threads:** {total_threads}\n")
+    index_parts.append(f"- **Gesamtnachrichten:** {total_messages}\n")
+    
+    if total_threads > 0:
+        avg_messages = total_messages / total_threads
+        index_parts.append(f"- **Durchschnitt pro Thread:** {avg_messages:.1f} Nachrichten\n")
+    
+    index_parts.append(f"- **Gesamtgröße:** {total_size_mb:.2f} MB\n")
+    
+    if stats:
+        largest = top_files[0]
+        smallest = min(stats, key=lambda x: x['size_kb'])
+        index_parts.append(f"- **Größte Datei:** {largest['filename']} ({largest['size_kb']:.1f} KB)\n")
+        index_parts.append(f"- **Kleinste Datei:** {smallest['filename']} ({smallest['size_kb']:.1f} KB)\n")
+    
+    index_parts.append(f"\n**Ordner:** `{folder}`\n")
+    index_parts.append(f"**Index:** [00_INDEX.md](./00_INDEX.md)\n")
+    
+    index_file = os.path.join(folder, "00_INDEX.md")
+    with open(index_file, 'wb') as f:
+        f.write(''.join(index_parts).encode('utf-8'))
     
     # Zusammenfassung anzeigen
     print(f"\n{'='*60}")
@@ -286,12 +498,11 @@ def export_threads(input_file, max_threads=None, max_messages_per_file=None):
         avg_messages = total_messages / total_threads
         print(f"✓ Durchschnitt pro Thread: {avg_messages:.1f} Nachrichten")
     
-    total_size_mb = sum(stat['size_kb'] for stat in stats) / 1024
     print(f"✓ Gesamtgröße: {total_size_mb:.2f} MB")
     
     if stats:
         print(f"\nTop 5 größte Dateien:")
-        for stat in sorted(stats, key=lambda x: x['size_kb'], reverse=True)[:5]:
+        for stat in top_files:
             print(f"  {stat['filename']}: {stat['messages']} Nachrichten ({stat['size_kb']:.1f} KB)")
     
     print(f"\n✅ Export abgeschlossen!")